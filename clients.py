@@ -0,0 +1,101 @@
+"""
+Shared API Clients
+
+Lazily built clients for the graph nodes. Inside client_session() every
+LLM call goes through one pooled HTTP/2 connection pool, so TLS
+handshakes are paid once per run instead of per request.
+"""
+
+import contextlib
+import contextvars
+import functools
+
+import httpx
+from langchain_openai import ChatOpenAI
+from langchain_tavily import TavilySearch
+
+import config as settings
+from llm_cache import install_llm_cache
+
+
+# Clients of the active client_session(); copied into the asyncio tasks
+# LangGraph starts for each node, so every node of a run sees them
+_session = contextvars.ContextVar("client_session", default=None)
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=60.0
+    )
+
+
+@contextlib.asynccontextmanager
+async def client_session():
+    """Share one pooled HTTP client between the API calls made inside.
+
+    The pool is bound to the running event loop and is closed when the
+    block exits.
+    """
+    http_client = _new_http_client()
+    token = _session.set({"http": http_client, "structured": {}})
+    try:
+        yield
+    finally:
+        _session.reset(token)
+        await http_client.aclose()
+
+
+def get_http_client():
+    """Pooled async HTTP client of the active session, or None outside one"""
+    session = _session.get()
+    return session["http"] if session else None
+
+
+def _new_llm(http_client=None) -> ChatOpenAI:
+    settings.init_config()
+    install_llm_cache()
+    return ChatOpenAI(
+        model="gpt-4o",
+        temperature=0,
+        http_async_client=http_client
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _default_llm() -> ChatOpenAI:
+    return _new_llm()
+
+
+@functools.lru_cache(maxsize=None)
+def _default_structured_llm(schema):
+    return _default_llm().with_structured_output(schema)
+
+
+def get_llm() -> ChatOpenAI:
+    """Chat model, sharing the session's pooled HTTP client when there is one"""
+    session = _session.get()
+    if session is None:
+        return _default_llm()
+    if "llm" not in session:
+        session["llm"] = _new_llm(session["http"])
+    return session["llm"]
+
+
+def get_structured_llm(schema):
+    """get_llm() bound to a structured output schema, built once per schema"""
+    session = _session.get()
+    if session is None:
+        return _default_structured_llm(schema)
+    structured = session["structured"]
+    if schema not in structured:
+        structured[schema] = get_llm().with_structured_output(schema)
+    return structured[schema]
+
+
+@functools.lru_cache(maxsize=1)
+def get_tavily() -> TavilySearch:
+    """Tavily web search tool"""
+    settings.init_config()
+    return TavilySearch(max_results=3)
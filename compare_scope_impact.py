@@ -6,183 +6,172 @@ This script runs the research assistant N times with the same topic:
 - Iteration 1: Clean slate (no SCOPE rules)
 - Iterations 2-N: With accumulated learned rules from previous iterations
 
+With --baseline-runs B, iterations 1-B are all clean-slate baselines. They
+are independent, so they run in parallel; each extra baseline learns in its
+own scope_data_baseline_<i> directory. Only iteration 1 seeds the rules used
+by the sequential SCOPE iterations that follow.
+
 It captures metrics and generates a markdown table for presentation.
 """
-import subprocess
-import json
-import os
+import asyncio
+import contextlib
+import io
+import sys
 import argparse
-import re
 from pathlib import Path
 from datetime import datetime
 
+from graph import build_research_graph
+from main import arun_research_assistant
+from scope_storage import discard_dir, read_json, write_json
 
-def clear_scope_data():
-    """Clear SCOPE data to start fresh."""
-    scope_path = Path("scope_data")
-    if scope_path.exists():
-        import shutil
-        shutil.rmtree(scope_path)
-    scope_path.mkdir(exist_ok=True)
-    (scope_path / "prompt_updates").mkdir(exist_ok=True)
-    (scope_path / "strategic_memory").mkdir(exist_ok=True)
-    print("✅ Cleared SCOPE data\n")
-
-
-def run_research(topic: str, num_analysts: int = 1, run_label: str = "Run"):
-    """Run the research assistant and capture output."""
-    print(f"{'='*70}")
-    print(f"{run_label}: Researching '{topic}'")
-    print(f"{'='*70}\n")
-
-    input_data = f"{topic}\n{num_analysts}\n\n"
-
-    result = subprocess.run(
-        ["python", "main.py"],
-        input=input_data,
-        capture_output=True,
-        text=True,
-        cwd="."
-    )
-
-    return result.stdout, result.stderr
-
-
-def extract_scope_messages(output: str):
-    """Extract SCOPE learning messages from output."""
-    lines = output.split('\n')
-    scope_messages = [line for line in lines if '📚 SCOPE learned' in line]
-    return scope_messages
-
-
-def extract_final_report(output: str):
-    """Extract the final report from output."""
-    lines = output.split('\n')
-
-    # Find the FINAL REPORT section
-    start_idx = None
-    for i, line in enumerate(lines):
-        if 'FINAL REPORT' in line or 'Final Report' in line:
-            start_idx = i
-            break
-
-    if start_idx is None:
-        return None
-
-    # Extract everything after FINAL REPORT header
-    report_lines = []
-    in_report = False
-    for line in lines[start_idx:]:
-        if '=' * 20 in line and not in_report:
-            in_report = True
-            continue
-        if in_report:
-            report_lines.append(line)
-
-    return '\n'.join(report_lines).strip()
+# rules file path -> (mtime_ns, size, parsed rules) of its last read
+_RULES_CACHE = {}
 
 
-def count_sources_in_report(report: str):
-    """Count number of sources cited in the report."""
-    if not report:
-        return 0
+def clear_scope_data(scope_path: Path = Path("scope_data")):
+    """Clear SCOPE data to start fresh."""
+    discard_dir(scope_path)
+    for leaf in ("prompt_updates", "strategic_memory"):
+        (scope_path / leaf).mkdir(parents=True, exist_ok=True)
+    print(f"✅ Cleared SCOPE data ({scope_path})\n")
 
-    # Look for common source patterns like [1], [2], etc. or URLs
-    citation_patterns = [
-        r'\[\d+\]',  # [1], [2], etc.
-        r'https?://[^\s\)]+',  # URLs
-    ]
 
-    sources = set()
-    for pattern in citation_patterns:
-        matches = re.findall(pattern, report)
-        sources.update(matches)
+async def run_research(graph, topic: str, num_analysts: int = 1, thread_id: str = "1",
+                       scope_data_path: str = None):
+    """Run the research assistant in-process and return its final state values.
 
-    return len(sources)
+    Safe to run concurrently: each run uses its own thread_id.
+    Callers decide whether to silence the assistant's progress output.
+    """
+    try:
+        await arun_research_assistant(
+            topic,
+            num_analysts,
+            thread_id=thread_id,
+            graph=graph,
+            interactive=False,
+            scope_data_path=scope_data_path
+        )
+    except Exception as e:
+        print(f"❌ Research run {thread_id} failed: {e}", file=sys.stderr)
 
+    thread = {"configurable": {"thread_id": thread_id}}
+    return (await graph.aget_state(thread)).values
 
-def save_report(report: str, filename: str):
-    """Save report to file."""
-    output_dir = Path("comparison_outputs")
-    output_dir.mkdir(exist_ok=True)
 
+def save_report(report: str, output_dir: Path, filename: str):
+    """Save report to file. ``output_dir`` must already exist."""
     filepath = output_dir / filename
-    with open(filepath, 'w') as f:
-        f.write(report)
-
+    filepath.write_text(report)
     return filepath
 
 
-def get_strategic_rules():
-    """Get current strategic rules."""
-    rules_file = Path("scope_data/strategic_memory/global_rules.json")
-    if not rules_file.exists():
+def get_strategic_rules(scope_path: Path = Path("scope_data")):
+    """Get current strategic rules.
+
+    The parsed rules are cached and only re-read when the file changes.
+    """
+    rules_file = scope_path / "strategic_memory" / "global_rules.json"
+    try:
+        stat = rules_file.stat()
+    except FileNotFoundError:
         return {}
 
-    with open(rules_file) as f:
-        return json.load(f)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _RULES_CACHE.get(rules_file)
+    if cached is not None and cached[:2] == key:
+        return cached[2]
 
+    rules = read_json(rules_file)
 
-def count_total_rules(rules: dict):
-    """Count total number of strategic rules."""
-    if not rules:
-        return 0
-    total = 0
-    for agent_name, domains in rules.items():
-        for domain, rule_list in domains.items():
-            total += len(rule_list)
-    return total
-
-
-def print_rules_summary(rules: dict):
-    """Print a summary of strategic rules."""
-    if not rules:
-        print("   No strategic rules yet")
-        return
+    _RULES_CACHE[rules_file] = (*key, rules)
+    return rules
 
-    total_rules = sum(len(agent_rules) for agent in rules.values()
-                      for agent_rules in agent.values())
-    print(f"   Total strategic rules: {total_rules}")
 
-    for agent_name, domains in rules.items():
-        print(f"\n   📌 {agent_name}:")
-        for domain, rule_list in domains.items():
-            for rule in rule_list:
-                print(f"      • {rule['rule'][:80]}...")
+def count_total_rules(rules: dict):
+    """Count total number of strategic rules."""
+    return sum(len(rule_list) for domains in (rules or {}).values()
+               for rule_list in domains.values())
+
+
+def record_iteration(i: int, state: dict, rules: dict, previous_rules_count: int,
+                     reports_dir: Path, rules_dir: Path):
+    """Compute, save and print the metrics for one iteration."""
+    # Extract metrics
+    scope_messages = state.get('scope_events', [])
+    report = state.get('final_report')
+
+    # Calculate metrics
+    total_rules = count_total_rules(rules)
+    new_rules = total_rules - previous_rules_count
+    report_length = len(report) if report else 0
+    sources_cited = len(state.get('citations', []))
+    query_improvements = len(scope_messages)
+
+    # Save report
+    if report:
+        save_report(report, reports_dir, f"report_iter_{i}.txt")
+
+    # Save rules snapshot
+    if rules:
+        write_json(rules_dir / f"rules_iter_{i}.json", rules)
+
+    # Print iteration summary
+    print("\n" + "-"*70)
+    print(f"ITERATION {i} SUMMARY:")
+    print("-"*70)
+    print(f"  📝 Report length: {report_length:,} characters")
+    print(f"  📚 Sources cited: {sources_cited}")
+    print(f"  🔍 Query improvement events: {query_improvements}")
+    print(f"  ➕ New rules learned: {new_rules}")
+    print(f"  📊 Total accumulated rules: {total_rules}")
+
+    return {
+        'iteration': i,
+        'report_length': report_length,
+        'sources_cited': sources_cited,
+        'query_improvements': query_improvements,
+        'new_rules': new_rules,
+        'total_rules': total_rules
+    }
 
 
 def generate_markdown_table(iterations_data: list):
     """Generate markdown table from iterations data."""
-    table = "## SCOPE Learning Progress\n\n"
-    table += "| Iteration | Report Length (chars) | Sources Cited | Query Improvements | New Rules Learned | Total Rules | Gemini Score | Grok Score |\n"
-    table += "|-----------|----------------------|---------------|-------------------|-------------------|-------------|--------------|------------|\n"
+    parts = [
+        "## SCOPE Learning Progress\n\n",
+        "| Iteration | Report Length (chars) | Sources Cited | Query Improvements | New Rules Learned | Total Rules | Gemini Score | Grok Score |\n",
+        "|-----------|----------------------|---------------|-------------------|-------------------|-------------|--------------|------------|\n",
+    ]
 
     for data in iterations_data:
-        table += f"| {data['iteration']} | {data['report_length']:,} | {data['sources_cited']} | {data['query_improvements']} | {data['new_rules']} | {data['total_rules']} | TBD | TBD |\n"
+        parts.append(f"| {data['iteration']} | {data['report_length']:,} | {data['sources_cited']} | {data['query_improvements']} | {data['new_rules']} | {data['total_rules']} | TBD | TBD |\n")
 
-    table += "\n### Notes\n"
-    table += "- **Report Length**: Character count of the final research report\n"
-    table += "- **Sources Cited**: Number of unique sources referenced in the report\n"
-    table += "- **Query Improvements**: Number of SCOPE learning events (fewer = better queries)\n"
-    table += "- **New Rules Learned**: Strategic rules learned in this iteration\n"
-    table += "- **Total Rules**: Cumulative strategic rules across all iterations\n"
-    table += "- **Gemini/Grok Scores**: To be filled after manual evaluation\n"
+    parts.extend([
+        "\n### Notes\n",
+        "- **Report Length**: Character count of the final research report\n",
+        "- **Sources Cited**: Number of unique sources referenced in the report\n",
+        "- **Query Improvements**: Number of SCOPE learning events (fewer = better queries)\n",
+        "- **New Rules Learned**: Strategic rules learned in this iteration\n",
+        "- **Total Rules**: Cumulative strategic rules across all iterations\n",
+        "- **Gemini/Grok Scores**: To be filled after manual evaluation\n",
+    ])
 
-    return table
+    return "".join(parts)
 
 
-def save_iteration_data(iterations_data: list, output_dir: Path):
+def save_iteration_data(iterations_data: list, output_dir: Path, timestamp: datetime):
     """Save iteration data to JSON file."""
     json_file = output_dir / "iteration_data.json"
-    with open(json_file, 'w') as f:
-        json.dump({
-            'timestamp': datetime.now().isoformat(),
-            'iterations': iterations_data
-        }, f, indent=2)
+    write_json(json_file, {
+        'timestamp': timestamp.isoformat(),
+        'iterations': iterations_data
+    })
     return json_file
 
 
-def main():
+async def main():
     parser = argparse.ArgumentParser(
         description='Demonstrate SCOPE impact through iterative learning'
     )
@@ -198,9 +187,24 @@ def main():
         default=None,
         help='Research topic (will prompt if not provided)'
     )
+    parser.add_argument(
+        '--baseline-runs', '-b',
+        type=int,
+        default=1,
+        help='Number of clean-slate baseline iterations, run in parallel (default: 1)'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=4,
+        help='Maximum number of baseline iterations to run at once (default: 4)'
+    )
 
     args = parser.parse_args()
 
+    # One timestamp identifies the whole run in every output file
+    run_started = datetime.now()
+
     num_iterations = args.iterations
     if num_iterations < 2:
         print("❌ Error: Number of iterations must be at least 2")
@@ -211,13 +215,21 @@ def main():
         if response != 'yes':
             return
 
+    baseline_runs = args.baseline_runs
+    if not 1 <= baseline_runs < num_iterations:
+        print("❌ Error: Baseline runs must be at least 1 and fewer than the iterations")
+        return
+
     print("\n" + "="*70)
     print("SCOPE ITERATIVE LEARNING DEMONSTRATION")
     print("="*70)
     print(
         f"\nThis demo runs the research assistant {num_iterations} times with the same topic:")
-    print("  • Iteration 1: Clean slate (no SCOPE rules)")
-    print(f"  • Iterations 2-{num_iterations}: With accumulated learned rules")
+    if baseline_runs == 1:
+        print("  • Iteration 1: Clean slate (no SCOPE rules)")
+    else:
+        print(f"  • Iterations 1-{baseline_runs}: Clean slate baselines (run in parallel)")
+    print(f"  • Iterations {baseline_runs + 1}-{num_iterations}: With accumulated learned rules")
     print("\nWe'll track improvements across iterations!\n")
 
     # Get topic from user
@@ -231,13 +243,12 @@ def main():
     print(f"\n📋 Research Topic: '{topic}'")
     print(f"🔄 Iterations: {num_iterations}")
 
-    # Prepare output directory
+    # Prepare output directories once, up front
     output_dir = Path("comparison_outputs")
-    output_dir.mkdir(exist_ok=True)
     reports_dir = output_dir / "reports"
-    reports_dir.mkdir(exist_ok=True)
     rules_dir = output_dir / "rules_snapshots"
-    rules_dir.mkdir(exist_ok=True)
+    for directory in (reports_dir, rules_dir):
+        directory.mkdir(parents=True, exist_ok=True)
 
     # Clear SCOPE data for clean start
     print("\n" + "="*70)
@@ -245,75 +256,71 @@ def main():
     print("="*70 + "\n")
     clear_scope_data()
 
+    # Compile the research graph once and reuse it for every iteration;
+    # each run gets its own thread_id so checkpoints never collide.
+    graph = build_research_graph()
+
     iterations_data = []
-    previous_rules_count = 0
 
-    # Run iterations
-    for i in range(1, num_iterations + 1):
+    # Baseline phase: clean-slate runs don't depend on each other, so they
+    # run concurrently. Iteration 1 learns into scope_data to seed the SCOPE
+    # phase; any extra baselines learn in isolated directories.
+    baseline_paths = {1: Path("scope_data")}
+    for i in range(2, baseline_runs + 1):
+        baseline_paths[i] = Path(f"scope_data_baseline_{i}")
+        clear_scope_data(baseline_paths[i])
+
+    print("\n" + "="*70)
+    if baseline_runs == 1:
+        print(f"ITERATION 1/{num_iterations}")
+    else:
+        print(f"ITERATIONS 1-{baseline_runs}/{num_iterations} "
+              f"({min(args.workers, baseline_runs)} in parallel)")
+    print("(Baseline - No SCOPE Rules)")
+    print("="*70 + "\n")
+    print(f"Researching '{topic}'...\n")
+
+    workers = asyncio.Semaphore(max(args.workers, 1))
+
+    async def run_baseline(i):
+        scope_data_path = str(baseline_paths[i]) if i > 1 else None
+        async with workers:
+            return await run_research(graph, topic, num_analysts=1, thread_id=str(i),
+                                      scope_data_path=scope_data_path)
+
+    # Keep the research assistant's own progress output off the console
+    with contextlib.redirect_stdout(io.StringIO()):
+        baseline_states = await asyncio.gather(
+            *(run_baseline(i) for i in range(1, baseline_runs + 1)))
+
+    for i, state in enumerate(baseline_states, 1):
+        rules = get_strategic_rules(baseline_paths[i])
+        iterations_data.append(record_iteration(
+            i, state, rules, 0, reports_dir, rules_dir))
+
+    # The extra baseline stores are snapshotted now; drop them so a later
+    # comparison never starts from their rules
+    for i in range(2, baseline_runs + 1):
+        discard_dir(baseline_paths[i])
+
+    # SCOPE phase: sequential, since each run builds on the rules before it
+    previous_rules_count = iterations_data[0]['total_rules']
+    for i in range(baseline_runs + 1, num_iterations + 1):
+        print(f"\n⏭️  Proceeding to iteration {i}...")
         print("\n" + "="*70)
         print(f"ITERATION {i}/{num_iterations}")
-        if i == 1:
-            print("(Baseline - No SCOPE Rules)")
-        else:
-            print(f"(With {previous_rules_count} accumulated rules)")
+        print(f"(With {previous_rules_count} accumulated rules)")
         print("="*70 + "\n")
+        print(f"Researching '{topic}'...\n")
 
-        # Run research
-        stdout, stderr = run_research(
-            topic,
-            num_analysts=1,
-            run_label=f"ITERATION {i}"
-        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            state = await run_research(graph, topic, num_analysts=1, thread_id=str(i))
 
-        # Extract metrics
-        scope_messages = extract_scope_messages(stdout)
-        report = extract_final_report(stdout)
-        rules = get_strategic_rules()
-
-        # Calculate metrics
-        total_rules = count_total_rules(rules)
-        new_rules = total_rules - previous_rules_count
-        report_length = len(report) if report else 0
-        sources_cited = count_sources_in_report(report) if report else 0
-        query_improvements = len(scope_messages)
-
-        # Store iteration data
-        iteration_data = {
-            'iteration': i,
-            'report_length': report_length,
-            'sources_cited': sources_cited,
-            'query_improvements': query_improvements,
-            'new_rules': new_rules,
-            'total_rules': total_rules
-        }
+        iteration_data = record_iteration(
+            i, state, get_strategic_rules(), previous_rules_count,
+            reports_dir, rules_dir)
         iterations_data.append(iteration_data)
-
-        # Save report
-        if report:
-            report_file = reports_dir / f"report_iter_{i}.txt"
-            with open(report_file, 'w') as f:
-                f.write(report)
-
-        # Save rules snapshot
-        if rules:
-            rules_file = rules_dir / f"rules_iter_{i}.json"
-            with open(rules_file, 'w') as f:
-                json.dump(rules, f, indent=2)
-
-        # Print iteration summary
-        print("\n" + "-"*70)
-        print(f"ITERATION {i} SUMMARY:")
-        print("-"*70)
-        print(f"  📝 Report length: {report_length:,} characters")
-        print(f"  📚 Sources cited: {sources_cited}")
-        print(f"  🔍 Query improvement events: {query_improvements}")
-        print(f"  ➕ New rules learned: {new_rules}")
-        print(f"  📊 Total accumulated rules: {total_rules}")
-
-        if i < num_iterations:
-            print(f"\n⏭️  Proceeding to iteration {i+1}...")
-
-        previous_rules_count = total_rules
+        previous_rules_count = iteration_data['total_rules']
 
     # Generate summary
     print("\n" + "="*70)
@@ -324,29 +331,28 @@ def main():
     markdown_table = generate_markdown_table(iterations_data)
     summary_file = output_dir / "results_summary.md"
 
-    with open(summary_file, 'w') as f:
-        f.write(f"# SCOPE Learning Progress Report\n\n")
-        f.write(f"**Research Topic:** {topic}\n\n")
-        f.write(
-            f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        f.write(f"**Total Iterations:** {num_iterations}\n\n")
-        f.write("---\n\n")
-        f.write(markdown_table)
-        f.write("\n---\n\n")
-        f.write("## Files Generated\n\n")
-        f.write(
-            f"- Reports: `comparison_outputs/reports/report_iter_[1-{num_iterations}].txt`\n")
-        f.write(
-            f"- Rules Snapshots: `comparison_outputs/rules_snapshots/rules_iter_[1-{num_iterations}].json`\n")
-        f.write(f"- Raw Data: `comparison_outputs/iteration_data.json`\n\n")
-        f.write("## Next Steps\n\n")
-        f.write("1. Review each report in the `reports/` folder\n")
-        f.write("2. Send each report to Gemini and Grok for scoring (1-10)\n")
-        f.write("3. Update the Gemini Score and Grok Score columns in this table\n")
-        f.write("4. Use this table in your LangChain community presentation\n")
+    summary = [
+        "# SCOPE Learning Progress Report\n\n",
+        f"**Research Topic:** {topic}\n\n",
+        f"**Date:** {run_started.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        f"**Total Iterations:** {num_iterations}\n\n",
+        "---\n\n",
+        markdown_table,
+        "\n---\n\n",
+        "## Files Generated\n\n",
+        f"- Reports: `comparison_outputs/reports/report_iter_[1-{num_iterations}].txt`\n",
+        f"- Rules Snapshots: `comparison_outputs/rules_snapshots/rules_iter_[1-{num_iterations}].json`\n",
+        "- Raw Data: `comparison_outputs/iteration_data.json`\n\n",
+        "## Next Steps\n\n",
+        "1. Review each report in the `reports/` folder\n",
+        "2. Send each report to Gemini and Grok for scoring (1-10)\n",
+        "3. Update the Gemini Score and Grok Score columns in this table\n",
+        "4. Use this table in your LangChain community presentation\n",
+    ]
+    summary_file.write_text("".join(summary))
 
     # Save JSON data
-    json_file = save_iteration_data(iterations_data, output_dir)
+    json_file = save_iteration_data(iterations_data, output_dir, run_started)
 
     # Display results
     print(markdown_table)
@@ -371,11 +377,12 @@ def main():
     print(f"\n💡 Tip: To run more iterations, use:")
     print(f"   python compare_scope_impact.py --iterations 20")
     print(f"   python compare_scope_impact.py --iterations 10 --topic 'your topic here'")
+    print(f"   python compare_scope_impact.py --iterations 10 --baseline-runs 5")
 
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except KeyboardInterrupt:
         print("\n\n❌ Demo interrupted by user")
     except Exception as e:
@@ -1,22 +1,49 @@
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
-LANGSMITH_API_KEY = os.getenv("LANGSMITH_API_KEY")
-LANGSMITH_TRACING = os.getenv("LANGSMITH_TRACING", "true")
-LANGSMITH_PROJECT = os.getenv("LANGSMITH_PROJECT", "research-assistant")
-
-# SCOPE settings
-SCOPE_DATA_PATH = os.getenv("SCOPE_DATA_PATH", "./scope_data")
-ENABLE_SCOPE = os.getenv("ENABLE_SCOPE", "true").lower() == "true"
-
-# Set environment variables for LangSmith
-if LANGSMITH_API_KEY:
-    os.environ["LANGSMITH_API_KEY"] = LANGSMITH_API_KEY
-if LANGSMITH_TRACING:
-    os.environ["LANGSMITH_TRACING"] = LANGSMITH_TRACING
-if LANGSMITH_PROJECT:
-    os.environ["LANGSMITH_PROJECT"] = LANGSMITH_PROJECT
+
+# Settings are read from the environment (and .env) on first access, e.g.
+# config.OPENAI_API_KEY, so importing this module has no side effects
+_settings = {}
+
+
+def init_config():
+    """Load .env and read settings. Safe to call more than once."""
+    if _settings:
+        return
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    settings = {
+        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY"),
+        "TAVILY_API_KEY": os.getenv("TAVILY_API_KEY"),
+        "LANGSMITH_API_KEY": os.getenv("LANGSMITH_API_KEY"),
+        "LANGSMITH_TRACING": os.getenv("LANGSMITH_TRACING", "true"),
+        "LANGSMITH_PROJECT": os.getenv("LANGSMITH_PROJECT", "research-assistant"),
+
+        # SCOPE settings
+        "SCOPE_DATA_PATH": os.getenv("SCOPE_DATA_PATH", "./scope_data"),
+        "ENABLE_SCOPE": os.getenv("ENABLE_SCOPE", "true").lower() == "true",
+
+        # Maximum graph tasks (e.g. concurrent analyst interviews) in flight at once
+        "MAX_CONCURRENCY": int(os.getenv("MAX_CONCURRENCY", "8")),
+    }
+
+    # Set environment variables for LangSmith
+    if settings["LANGSMITH_API_KEY"]:
+        os.environ["LANGSMITH_API_KEY"] = settings["LANGSMITH_API_KEY"]
+    if settings["LANGSMITH_TRACING"]:
+        os.environ["LANGSMITH_TRACING"] = settings["LANGSMITH_TRACING"]
+    if settings["LANGSMITH_PROJECT"]:
+        os.environ["LANGSMITH_PROJECT"] = settings["LANGSMITH_PROJECT"]
+
+    _settings.update(settings)
+
+
+def __getattr__(name):
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    init_config()
+    try:
+        return _settings[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
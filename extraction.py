@@ -0,0 +1,115 @@
+"""
+Information Extraction Tasks
+
+Shared by simple_demo.py and simple_compare.py: the base prompt, the
+sample tasks, and the extract/observe steps each run goes through.
+"""
+import functools
+import os
+from langchain_core.messages import SystemMessage, HumanMessage
+
+# SCOPE agent that learns the extraction rules
+AGENT_NAME = "info_extractor"
+
+# Base prompt
+BASE_PROMPT = """You are an information extraction specialist.
+Your task is to extract requested information from text accurately.
+
+## Core Instructions:
+- Extract only the requested information
+- Be accurate and precise
+- If information is missing, state "Not found"
+- Provide clean, structured output
+"""
+
+# Extraction tasks
+EXTRACTION_TASKS = [
+    {
+        "instruction": "Extract the email address",
+        "text": "Contact John Doe at john.doe@example.com for support"
+    },
+    {
+        "instruction": "Parse and extract: name, age, and city",
+        "text": "Name: Jane Smith, Age: 28, City: Boston"
+    },
+    {
+        "instruction": "Extract the phone number",
+        "text": "You can email us at support@company.com"
+    },
+    {
+        "instruction": "Extract name, age, city, and phone",
+        "text": "name:John|age:35|city:NYC|phone:555-0123"
+    },
+    {
+        "instruction": "Extract all email addresses",
+        "text": "Team: alice@test.com, Bob <bob@example.org>, charlie@mail.net"
+    },
+]
+
+# Task messages never change, so build them once
+TASK_HUMAN_MESSAGES = [
+    HumanMessage(content=f"{task['instruction']}\n\nText: {task['text']}")
+    for task in EXTRACTION_TASKS
+]
+
+
+@functools.lru_cache(maxsize=1)
+def system_message(prompt):
+    """SystemMessage for a prompt, reused while the learned rules are unchanged."""
+    return SystemMessage(content=prompt)
+
+
+def build_prompt(optimizer):
+    """Base prompt plus the strategic rules SCOPE has learned so far."""
+    
+    strategic_rules = optimizer.get_strategic_rules_for_agent(AGENT_NAME)
+    current_prompt = BASE_PROMPT
+    if strategic_rules:
+        current_prompt += f"\n\n## Strategic Guidelines (Learned):\n{strategic_rules}"
+    return current_prompt
+
+
+async def extract_all(llm, current_prompt):
+    """Run every extraction task concurrently; outputs in task order."""
+    
+    responses = await llm.abatch([
+        [system_message(current_prompt), human_message]
+        for human_message in TASK_HUMAN_MESSAGES
+    ])
+    return [response.content for response in responses]
+
+
+async def observe_extraction(optimizer, instruction, text, output, current_prompt, task_id):
+    """Let SCOPE observe one extraction result."""
+    
+    return await optimizer.on_step_complete(
+        agent_name=AGENT_NAME,
+        agent_role="Information Extraction Specialist",
+        task=f"{instruction} | Text: {text}",
+        model_output=output,
+        observations=f"Extracted from: '{text[:50]}...'",
+        error=None,
+        current_system_prompt=current_prompt,
+        task_id=task_id
+    )
+
+
+def create_optimizer():
+    """SCOPE optimizer for the extraction agent (imports scope on first use)."""
+    
+    from scope import SCOPEOptimizer
+    from scope.models import create_openai_model
+    
+    scope_model = create_openai_model(
+        model="gpt-4o",
+        api_key=os.environ["OPENAI_API_KEY"]
+    )
+    
+    return SCOPEOptimizer(
+        synthesizer_model=scope_model,
+        exp_path="./scope_data",
+        enable_quality_analysis=True,
+        quality_analysis_frequency=1,
+        synthesis_mode="efficiency",
+        store_history=True
+    )
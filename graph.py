@@ -1,3 +1,5 @@
+import functools
+
 from langgraph.graph import START, END, StateGraph
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.types import Send
@@ -8,13 +10,13 @@ from nodes import (
     create_analysts, human_feedback, should_continue,
     generate_question, search_web, search_wikipedia,
     generate_answer, save_interview, route_messages,
-    write_section, write_report, write_introduction,
-    write_conclusion, finalize_report
+    write_section, prepare_report, write_report_bundle, finalize_report
 )
 
 
+@functools.lru_cache(maxsize=1)
 def build_interview_graph():
-    """Build the interview sub-graph"""
+    """Build the interview sub-graph (compiled once per process)"""
     interview_builder = StateGraph(InterviewState)
     interview_builder.add_node("ask_question", generate_question)
     interview_builder.add_node("search_web", search_web)
@@ -24,10 +26,11 @@ def build_interview_graph():
     interview_builder.add_node("write_section", write_section)
     
     interview_builder.add_edge(START, "ask_question")
+    # Both searches run concurrently in one step; answer_question waits for both
     interview_builder.add_edge("ask_question", "search_web")
     interview_builder.add_edge("ask_question", "search_wikipedia")
-    interview_builder.add_edge("search_web", "answer_question")
-    interview_builder.add_edge("search_wikipedia", "answer_question")
+    interview_builder.add_edge(
+        ["search_web", "search_wikipedia"], "answer_question")
     interview_builder.add_conditional_edges(
         "answer_question",
         route_messages,
@@ -58,17 +61,22 @@ def initiate_all_interviews(state: ResearchGraphState):
     ]
 
 
+@functools.lru_cache(maxsize=1)
 def build_research_graph():
-    """Build the main research graph"""
+    """Build the main research graph (compiled once per process)
+
+    The checkpointer is shared along with the graph. Checkpoints are keyed
+    by thread_id, so the graph can serve many runs as long as each uses its
+    own thread_id (arun_research_assistant picks a fresh one by default).
+    """
     interview_graph = build_interview_graph()
     
     builder = StateGraph(ResearchGraphState)
     builder.add_node("create_analysts", create_analysts)
     builder.add_node("human_feedback", human_feedback)
     builder.add_node("conduct_interview", interview_graph)
-    builder.add_node("write_report", write_report)
-    builder.add_node("write_introduction", write_introduction)
-    builder.add_node("write_conclusion", write_conclusion)
+    builder.add_node("prepare_report", prepare_report)
+    builder.add_node("write_report_bundle", write_report_bundle)
     builder.add_node("finalize_report", finalize_report)
     
     builder.add_edge(START, "create_analysts")
@@ -78,13 +86,9 @@ def build_research_graph():
         initiate_all_interviews,
         ["create_analysts", "conduct_interview"]
     )
-    builder.add_edge("conduct_interview", "write_report")
-    builder.add_edge("conduct_interview", "write_introduction")
-    builder.add_edge("conduct_interview", "write_conclusion")
-    builder.add_edge(
-        ["write_conclusion", "write_report", "write_introduction"],
-        "finalize_report"
-    )
+    builder.add_edge("conduct_interview", "prepare_report")
+    builder.add_edge("prepare_report", "write_report_bundle")
+    builder.add_edge("write_report_bundle", "finalize_report")
     builder.add_edge("finalize_report", END)
     
     memory = MemorySaver()
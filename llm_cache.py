@@ -0,0 +1,25 @@
+"""
+LLM Response Cache
+
+Opt-in SQLite cache for LLM responses, shared by the research assistant
+and the extraction demos. Reads LLM_CACHE_PATH straight from the
+environment, so installing it loads no other settings.
+"""
+
+import functools
+import os
+
+
+@functools.lru_cache(maxsize=1)
+def install_llm_cache():
+    """Install the SQLite response cache when LLM_CACHE_PATH is set.
+
+    All LLMs run at temperature=0, so replaying an identical prompt
+    (re-runs, regenerated reports) returns the stored answer. LangChain
+    consults the cache on invoke/ainvoke and batch calls, not on streams.
+    """
+    cache_path = os.getenv("LLM_CACHE_PATH")
+    if cache_path:
+        from langchain_core.globals import set_llm_cache
+        from langchain_community.cache import SQLiteCache
+        set_llm_cache(SQLiteCache(database_path=cache_path))
@@ -1,5 +1,7 @@
+import asyncio
+import uuid
+
 import config
-from graph import build_research_graph
 
 
 def print_analysts(analysts):
@@ -12,14 +14,50 @@ def print_analysts(analysts):
         print("-" * 50)
 
 
-def run_research_assistant(topic: str, max_analysts: int = 3, thread_id: str = "1"):
-    """Run the research assistant"""
-    graph = build_research_graph()
-    thread = {"configurable": {"thread_id": thread_id}}
-    
+async def arun_research_assistant(topic: str, max_analysts: int = 3, thread_id: str = None,
+                                  graph=None, interactive: bool = True,
+                                  scope_data_path: str = None):
+    """Run the research assistant on the current event loop
+
+    Pass a pre-built ``graph`` to reuse one compiled graph across runs,
+    ``interactive=False`` to skip the human feedback prompt, and
+    ``scope_data_path`` to let SCOPE learn in an isolated directory.
+    Each call starts a fresh checkpoint thread unless ``thread_id`` is given.
+    """
+    if graph is None:
+        # Deferred: importing the graph pulls in LangChain/LangGraph
+        from graph import build_research_graph
+        graph = build_research_graph()
+    # Cap parallel tasks so concurrent analysts stay within API rate limits.
+    # research_run_id keys this call's background SCOPE observations.
+    run_id = uuid.uuid4().hex
+    if thread_id is None:
+        # The compiled graph and its checkpointer are shared by every run in
+        # the process, so a fixed default would resume the previous run
+        thread_id = run_id
+    thread = {
+        "configurable": {"thread_id": thread_id, "research_run_id": run_id},
+        "max_concurrency": config.MAX_CONCURRENCY
+    }
+    if scope_data_path:
+        thread["configurable"]["scope_data_path"] = scope_data_path
+
+    # One pooled HTTP client serves the whole run and is closed with it
+    from clients import client_session
+    try:
+        async with client_session():
+            return await _arun_session(graph, thread, topic, max_analysts, interactive)
+    finally:
+        # Drop observations left behind by a failed or stopped run
+        from nodes import discard_observations
+        discard_observations(run_id)
+
+
+async def _arun_session(graph, thread, topic: str, max_analysts: int, interactive: bool):
+    """Drive one research run on ``graph`` and return the final report"""
     # Initial run - generate analysts
     print("\n=== Generating Analysts ===\n")
-    for event in graph.stream({
+    async for event in graph.astream({
         "topic": topic,
         "max_analysts": max_analysts
     }, thread, stream_mode="values"):
@@ -29,12 +67,14 @@ def run_research_assistant(topic: str, max_analysts: int = 3, thread_id: str = "
     
     # Get feedback
     print("\n=== Waiting for Human Feedback ===")
-    print("Current state:", graph.get_state(thread).next)
+    print("Current state:", (await graph.aget_state(thread)).next)
     
-    feedback = input("\nEnter feedback (press Enter to continue without feedback): ").strip()
+    feedback = ""
+    if interactive:
+        feedback = input("\nEnter feedback (press Enter to continue without feedback): ").strip()
     
     if feedback:
-        graph.update_state(
+        await graph.aupdate_state(
             thread,
             {"human_analyst_feedback": feedback},
             as_node="human_feedback"
@@ -42,7 +82,7 @@ def run_research_assistant(topic: str, max_analysts: int = 3, thread_id: str = "
         
         # Regenerate analysts with feedback
         print("\n=== Regenerating Analysts with Feedback ===\n")
-        for event in graph.stream(None, thread, stream_mode="values"):
+        async for event in graph.astream(None, thread, stream_mode="values"):
             analysts = event.get('analysts', '')
             if analysts:
                 print_analysts(analysts)
@@ -54,7 +94,7 @@ def run_research_assistant(topic: str, max_analysts: int = 3, thread_id: str = "
             return None
     
     # Confirm to proceed
-    graph.update_state(
+    await graph.aupdate_state(
         thread,
         {"human_analyst_feedback": None},
         as_node="human_feedback"
@@ -62,12 +102,12 @@ def run_research_assistant(topic: str, max_analysts: int = 3, thread_id: str = "
     
     # Continue with interviews and report generation
     print("\n=== Conducting Interviews and Generating Report ===\n")
-    for event in graph.stream(None, thread, stream_mode="updates"):
+    async for event in graph.astream(None, thread, stream_mode="updates"):
         node_name = next(iter(event.keys()))
         print(f"Processing: {node_name}")
     
     # Get final report
-    final_state = graph.get_state(thread)
+    final_state = await graph.aget_state(thread)
     report = final_state.values.get('final_report')
     
     print("\n" + "=" * 80)
@@ -78,6 +118,25 @@ def run_research_assistant(topic: str, max_analysts: int = 3, thread_id: str = "
     return report
 
 
+def run_research_assistant(topic: str, max_analysts: int = 3, thread_id: str = None,
+                           graph=None, interactive: bool = True,
+                           scope_data_path: str = None):
+    """Run the research assistant
+
+    Synchronous wrapper around arun_research_assistant. Callers that run
+    several sessions should await arun_research_assistant on one event loop
+    instead of starting a new loop per session.
+    """
+    return asyncio.run(arun_research_assistant(
+        topic,
+        max_analysts,
+        thread_id=thread_id,
+        graph=graph,
+        interactive=interactive,
+        scope_data_path=scope_data_path
+    ))
+
+
 def main():
     """Main entry point"""
     print("=== Research Assistant ===\n")
@@ -90,6 +149,7 @@ def main():
     max_analysts_input = input("Enter number of analysts (default 3): ").strip()
     max_analysts = int(max_analysts_input) if max_analysts_input else 3
     
+    config.init_config()
     run_research_assistant(topic, max_analysts)
 
 
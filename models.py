@@ -55,7 +55,10 @@ class ResearchGraphState(TypedDict):
     human_analyst_feedback: str
     analysts: List[Analyst]
     sections: Annotated[list, operator.add]
+    formatted_str_sections: str
     introduction: str
     content: str
     conclusion: str
     final_report: str
+    scope_events: Annotated[list, operator.add]
+    citations: list
@@ -1,104 +1,212 @@
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.messages import get_buffer_string
-from langchain_tavily import TavilySearch
-from langchain_community.document_loaders import WikipediaLoader
-from urllib.parse import urlparse
+from langchain_core.runnables import RunnableConfig
 import time
 import asyncio
+import functools
 import re
+import threading
+import os
 
 from models import (
     GenerateAnalystsState, InterviewState, ResearchGraphState,
     Perspectives, SearchQuery, Analyst
 )
 from prompts import (
-    analyst_instructions, question_instructions, search_instructions,
-    answer_instructions, section_writer_instructions, report_writer_instructions,
-    intro_conclusion_instructions
+    analyst_instructions, question_instructions, question_context,
+    search_instructions, answer_instructions, answer_context,
+    section_writer_instructions, section_writer_context,
+    report_writer_instructions, report_writer_context,
+    intro_conclusion_instructions, intro_conclusion_context
 )
-from config import SCOPE_DATA_PATH, ENABLE_SCOPE
+import config as settings
+from clients import get_llm, get_structured_llm, get_tavily
 from source_quality import assess_sources_quality, get_quality_observation
-
-llm = ChatOpenAI(model="gpt-4o", temperature=0)
-tavily_search = TavilySearch(max_results=3)
-
-# SCOPE optimizer (lazy initialization)
-_scope_optimizer = None
-
-
-def get_scope_optimizer():
-    """Get or create SCOPE optimizer instance."""
-    global _scope_optimizer
-    if _scope_optimizer is None and ENABLE_SCOPE:
-        try:
-            from scope import SCOPEOptimizer
-            from scope.models import create_openai_model
-            from config import OPENAI_API_KEY
-
-            # Create SCOPE-compatible model
-            scope_model = create_openai_model(
-                model="gpt-4o",
-                api_key=OPENAI_API_KEY
-            )
-
-            _scope_optimizer = SCOPEOptimizer(
-                synthesizer_model=scope_model,
-                exp_path=SCOPE_DATA_PATH,
-                enable_quality_analysis=True,
-                quality_analysis_frequency=1,  # Analyze every step
-                synthesis_mode="thoroughness",  # Comprehensive 7-dimension analysis
-                max_strategic_rules_per_domain=15,  # Increased from default 10
-                store_history=True
-            )
-        except Exception as e:
-            # SCOPE initialization failed, continue without it
-            print(f"⚠️  SCOPE initialization failed: {e}")
-            return None
-    return _scope_optimizer
-
-
-def _observe_with_scope(optimizer, agent_name, agent_role, task, model_output, observations, current_prompt, task_id):
-    """Helper to observe with SCOPE - bridges sync/async boundary."""
+from wikipedia_search import load_wikipedia
+
+# Citation patterns, compiled once: [1]-style references and raw URLs
+_CITATION_RE = re.compile(r"\[\d+\]")
+_URL_RE = re.compile(r"https?://[^\s\)]+")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# SCOPE optimizers (lazy initialization), one per SCOPE data path
+_scope_optimizers = {}
+_scope_optimizers_lock = threading.Lock()
+
+# Background SCOPE observation tasks, per research run (_run_id). Holding
+# them here keeps them alive until finalize_report awaits them.
+_pending_observations = {}
+
+
+def _scope_data_path(config: RunnableConfig = None):
+    """SCOPE data directory for this run"""
+    configurable = (config or {}).get("configurable") or {}
+    return configurable.get("scope_data_path") or settings.SCOPE_DATA_PATH
+
+
+def get_scope_optimizer(config: RunnableConfig = None):
+    """Get or create SCOPE optimizer instance.
+
+    Runs can learn in an isolated directory by setting
+    ``configurable.scope_data_path``; otherwise SCOPE_DATA_PATH is used.
+    """
+    if not settings.ENABLE_SCOPE:
+        return None
+
+    exp_path = _scope_data_path(config)
+
+    with _scope_optimizers_lock:
+        if exp_path not in _scope_optimizers:
+            try:
+                from scope import SCOPEOptimizer
+                from scope.models import create_openai_model
+
+                # Create SCOPE-compatible model
+                scope_model = create_openai_model(
+                    model="gpt-4o",
+                    api_key=settings.OPENAI_API_KEY
+                )
+
+                _scope_optimizers[exp_path] = SCOPEOptimizer(
+                    synthesizer_model=scope_model,
+                    exp_path=exp_path,
+                    enable_quality_analysis=True,
+                    quality_analysis_frequency=1,  # Analyze every step
+                    synthesis_mode="thoroughness",  # Comprehensive 7-dimension analysis
+                    max_strategic_rules_per_domain=15,  # Increased from default 10
+                    store_history=True
+                )
+            except Exception as e:
+                # SCOPE initialization failed, continue without it
+                print(f"⚠️  SCOPE initialization failed: {e}")
+                return None
+        return _scope_optimizers[exp_path]
+
+
+async def _observe_with_scope(optimizer, agent_name, agent_role, task, model_output, observations, current_prompt, task_id):
+    """Helper to observe with SCOPE from async nodes.
+
+    Returns the learning event message, or None if nothing was learned.
+    """
     if optimizer is None:
-        return
+        return None
 
     try:
-        # Bridge sync→async: SCOPE is async, LangGraph nodes are sync
-        result = asyncio.run(
-            optimizer.on_step_complete(
-                agent_name=agent_name,
-                agent_role=agent_role,
-                task=task,
-                model_output=model_output,
-                observations=observations,
-                error=None,
-                current_system_prompt=current_prompt,
-                task_id=task_id
-            )
+        result = await optimizer.on_step_complete(
+            agent_name=agent_name,
+            agent_role=agent_role,
+            task=task,
+            model_output=model_output,
+            observations=observations,
+            error=None,
+            current_system_prompt=current_prompt,
+            task_id=task_id
         )
         if result:
             guideline, guideline_type = result
-            print(f"📚 SCOPE learned ({guideline_type}): {guideline[:100]}...")
+            event = f"📚 SCOPE learned ({guideline_type}): {guideline[:100]}..."
+            print(event)
+            return event
     except Exception as e:
         # Silently skip if SCOPE observation fails
         pass
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_strategic_rules(exp_path, agent_name, rules_version):
+    return _scope_optimizers[exp_path].get_strategic_rules_for_agent(agent_name)
+
+
+def _rules_version(exp_path):
+    """(mtime, size) of the persisted strategic rules, or None if none yet"""
+    try:
+        stat = os.stat(os.path.join(exp_path, "strategic_memory", "global_rules.json"))
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _run_id(config: RunnableConfig = None):
+    """Research run identifier from the node config.
+
+    arun_research_assistant sets a unique ``research_run_id`` per call;
+    the checkpointer thread_id is the fallback for other callers.
+    """
+    configurable = (config or {}).get("configurable") or {}
+    return configurable.get("research_run_id") or configurable.get("thread_id")
+
+
+def get_strategic_rules(agent_name, config: RunnableConfig = None):
+    """Strategic rules for an agent, re-read only when the rules file changes.
+
+    Call only after get_scope_optimizer(config) returned an optimizer.
+    """
+    exp_path = _scope_data_path(config)
+    return _cached_strategic_rules(exp_path, agent_name, _rules_version(exp_path))
+
+
+def _url_netloc(url):
+    """Network location of a URL (what urlparse(url).netloc returns)"""
+    netloc = url.partition("://")[2]
+    for delimiter in "/?#":
+        netloc = netloc.partition(delimiter)[0]
+    return netloc
+
 
+def _query_keywords(query_text):
+    """Lowercase word tokens of a search query"""
+    return frozenset(_WORD_RE.findall(query_text.lower()))
 
-def create_analysts(state: GenerateAnalystsState):
+
+def _keyword_overlap(query_keywords, content):
+    """Count query keywords present in the first 500 chars of content"""
+    return len(query_keywords.intersection(
+        _WORD_RE.findall(content[:500].lower())))
+
+
+def _observe_in_background(config: RunnableConfig, optimizer, **observation):
+    """Start a SCOPE observation without blocking the calling node.
+
+    The task is kept per research run until finalize_report collects it.
+    """
+    if optimizer is None:
+        return
+    task = asyncio.create_task(_observe_with_scope(optimizer, **observation))
+    _pending_observations.setdefault(_run_id(config), []).append(task)
+
+
+async def _collect_observations(config: RunnableConfig):
+    """Wait for this run's background observations; return learning events"""
+    tasks = _pending_observations.pop(_run_id(config), [])
+    events = await asyncio.gather(*tasks)
+    return [event for event in events if event]
+
+
+def discard_observations(run_id):
+    """Cancel a run's uncollected background observations.
+
+    Called when a run ends, so runs that fail or stop before
+    finalize_report neither leak their tasks nor hand them to a later run.
+    """
+    for task in _pending_observations.pop(run_id, []):
+        task.cancel()
+
+
+async def create_analysts(state: GenerateAnalystsState):
     """Create analysts based on topic and feedback"""
     topic = state['topic']
     max_analysts = state['max_analysts']
     human_analyst_feedback = state.get('human_analyst_feedback', '')
 
-    structured_llm = llm.with_structured_output(Perspectives)
+    structured_llm = get_structured_llm(Perspectives)
     system_message = analyst_instructions.format(
         topic=topic,
         human_analyst_feedback=human_analyst_feedback,
         max_analysts=max_analysts
     )
 
-    analysts = structured_llm.invoke([
+    analysts = await structured_llm.ainvoke([
         SystemMessage(content=system_message),
         HumanMessage(content="Generate the set of analysts.")
     ])
@@ -119,27 +227,30 @@ def should_continue(state: GenerateAnalystsState):
     return "__end__"
 
 
-def generate_question(state: InterviewState):
+async def generate_question(state: InterviewState, config: RunnableConfig):
     """Node to generate a question with SCOPE optimization"""
-    optimizer = get_scope_optimizer()
+    optimizer = get_scope_optimizer(config)
     agent_name = "analyst_question_generator"
 
     analyst = state["analyst"]
     messages = state["messages"]
 
-    # Get evolved prompt from SCOPE if available
+    # Get evolved prompt from SCOPE if available. The instructions stay a
+    # static prefix (cacheable by the provider); the persona goes after it.
     if optimizer:
-        strategic_rules = optimizer.get_strategic_rules_for_agent(agent_name)
-        enhanced_prompt = question_instructions.format(
-            goals=analyst.persona) + strategic_rules
+        strategic_rules = get_strategic_rules(agent_name, config)
+        enhanced_prompt = question_instructions + strategic_rules
     else:
-        enhanced_prompt = question_instructions.format(goals=analyst.persona)
+        enhanced_prompt = question_instructions
 
-    question = llm.invoke([SystemMessage(content=enhanced_prompt)] + messages)
+    question = await get_llm().ainvoke([
+        SystemMessage(content=enhanced_prompt),
+        HumanMessage(content=question_context.format(goals=analyst.persona))
+    ] + messages)
 
-    # Let SCOPE observe and learn
-    _observe_with_scope(
-        optimizer,
+    # Let SCOPE observe and learn, off the critical path
+    _observe_in_background(
+        config, optimizer,
         agent_name=agent_name,
         agent_role="Generate insightful interview questions",
         task=f"Interview {analyst.affiliation} on {analyst.persona[:80]}",
@@ -152,29 +263,34 @@ def generate_question(state: InterviewState):
     return {"messages": [question]}
 
 
-def search_web(state: InterviewState):
+async def search_web(state: InterviewState, config: RunnableConfig):
     """Retrieve docs from web search with SCOPE optimization"""
-    optimizer = get_scope_optimizer()
+    optimizer = get_scope_optimizer(config)
     agent_name = "search_query_generator_web"
 
     # Get evolved prompt from SCOPE if available
     if optimizer:
-        strategic_rules = optimizer.get_strategic_rules_for_agent(agent_name)
+        strategic_rules = get_strategic_rules(agent_name, config)
         enhanced_prompt = search_instructions + strategic_rules
     else:
         enhanced_prompt = search_instructions
 
     # Generate search query with evolved prompt
-    structured_llm = llm.with_structured_output(SearchQuery)
-    search_query = structured_llm.invoke([
+    structured_llm = get_structured_llm(SearchQuery)
+    search_query = await structured_llm.ainvoke([
         SystemMessage(content=enhanced_prompt)
     ] + state['messages'])
 
     query_text = search_query.search_query
 
-    # Execute search
-    data = tavily_search.invoke({"query": query_text})
-    search_docs = data.get("results", data)
+    # Execute search. A failed backend must not abort the parallel
+    # Wikipedia branch, so treat it as an empty result set
+    try:
+        data = await get_tavily().ainvoke({"query": query_text})
+        search_docs = data.get("results", data)
+    except Exception as e:
+        print(f"⚠️  Web search failed: {e}")
+        search_docs = []
 
     # Format results summary for SCOPE with quality metrics
     if search_docs:
@@ -184,24 +300,21 @@ def search_web(state: InterviewState):
         # Extract other metrics
         domains = set()
         total_length = 0
-        query_keywords = set(query_text.lower().split())
+        query_keywords = _query_keywords(query_text)
         relevance_scores = []
 
         for doc in search_docs:
             # Domain diversity
             url = doc.get('url', '')
             if url:
-                domain = urlparse(url).netloc
-                domains.add(domain)
+                domains.add(_url_netloc(url))
 
             # Content quality
             content = doc.get('content', '')
             total_length += len(content)
 
             # Relevance (keyword overlap)
-            content_keywords = set(content[:500].lower().split())
-            overlap = len(query_keywords & content_keywords)
-            relevance_scores.append(overlap)
+            relevance_scores.append(_keyword_overlap(query_keywords, content))
 
         avg_length = total_length // len(search_docs) if search_docs else 0
         avg_relevance = sum(
@@ -224,9 +337,9 @@ def search_web(state: InterviewState):
     else:
         results_summary = "Found 0 results"
 
-    # Let SCOPE observe and learn (with observations)
-    _observe_with_scope(
-        optimizer,
+    # Let SCOPE observe and learn (with observations), off the critical path
+    _observe_in_background(
+        config, optimizer,
         agent_name=agent_name,
         agent_role="Generate effective web search queries",
         task=f"Generate query for: {state['messages'][-1].content[:150]}",
@@ -244,37 +357,38 @@ def search_web(state: InterviewState):
     return {"context": [formatted_search_docs]}
 
 
-def search_wikipedia(state: InterviewState):
+async def search_wikipedia(state: InterviewState, config: RunnableConfig):
     """Retrieve docs from wikipedia with SCOPE optimization"""
-    optimizer = get_scope_optimizer()
+    optimizer = get_scope_optimizer(config)
     agent_name = "search_query_generator_wikipedia"
 
     # Get evolved prompt from SCOPE if available
     if optimizer:
-        strategic_rules = optimizer.get_strategic_rules_for_agent(agent_name)
+        strategic_rules = get_strategic_rules(agent_name, config)
         enhanced_prompt = search_instructions + strategic_rules
     else:
         enhanced_prompt = search_instructions
 
     # Generate search query with evolved prompt
-    structured_llm = llm.with_structured_output(SearchQuery)
-    search_query = structured_llm.invoke([
+    structured_llm = get_structured_llm(SearchQuery)
+    search_query = await structured_llm.ainvoke([
         SystemMessage(content=enhanced_prompt)
     ] + state['messages'])
 
     query_text = search_query.search_query
 
-    # Execute search
-    search_docs = WikipediaLoader(
-        query=query_text,
-        load_max_docs=2
-    ).load()
+    # Execute search (article fetches run concurrently)
+    try:
+        search_docs = await load_wikipedia(query_text, max_docs=2)
+    except Exception as e:
+        print(f"⚠️  Wikipedia search failed: {e}")
+        search_docs = []
 
     # Format results summary for SCOPE with quality metrics
     if search_docs:
         # Extract quality metrics
         total_length = 0
-        query_keywords = set(query_text.lower().split())
+        query_keywords = _query_keywords(query_text)
         relevance_scores = []
         article_titles = []
 
@@ -289,9 +403,7 @@ def search_wikipedia(state: InterviewState):
                 article_titles.append(source.split('/')[-1])
 
             # Relevance (keyword overlap)
-            content_keywords = set(content[:500].lower().split())
-            overlap = len(query_keywords & content_keywords)
-            relevance_scores.append(overlap)
+            relevance_scores.append(_keyword_overlap(query_keywords, content))
 
         avg_length = total_length // len(search_docs) if search_docs else 0
         avg_relevance = sum(
@@ -309,9 +421,9 @@ def search_wikipedia(state: InterviewState):
     else:
         results_summary = "Found 0 Wikipedia articles"
 
-    # Let SCOPE observe and learn (with observations)
-    _observe_with_scope(
-        optimizer,
+    # Let SCOPE observe and learn (with observations), off the critical path
+    _observe_in_background(
+        config, optimizer,
         agent_name=agent_name,
         agent_role="Generate effective Wikipedia search queries",
         task=f"Generate query for: {state['messages'][-1].content[:150]}",
@@ -329,17 +441,19 @@ def search_wikipedia(state: InterviewState):
     return {"context": [formatted_search_docs]}
 
 
-def generate_answer(state: InterviewState):
+async def generate_answer(state: InterviewState):
     """Node to answer a question"""
     analyst = state["analyst"]
     messages = state["messages"]
     context = state["context"]
 
-    system_message = answer_instructions.format(
-        goals=analyst.persona,
-        context=context
-    )
-    answer = llm.invoke([SystemMessage(content=system_message)] + messages)
+    answer = await get_llm().ainvoke([
+        SystemMessage(content=answer_instructions),
+        HumanMessage(content=answer_context.format(
+            goals=analyst.persona,
+            context=context
+        ))
+    ] + messages)
     answer.name = "expert"
 
     return {"messages": [answer]}
@@ -372,9 +486,9 @@ def route_messages(state: InterviewState, name: str = "expert"):
     return "ask_question"
 
 
-def write_section(state: InterviewState):
+async def write_section(state: InterviewState, config: RunnableConfig):
     """Write a section based on interview with SCOPE optimization"""
-    optimizer = get_scope_optimizer()
+    optimizer = get_scope_optimizer(config)
     agent_name = "section_writer"
 
     interview = state["interview"]
@@ -383,26 +497,26 @@ def write_section(state: InterviewState):
 
     # Get evolved prompt from SCOPE if available
     if optimizer:
-        strategic_rules = optimizer.get_strategic_rules_for_agent(agent_name)
-        enhanced_prompt = section_writer_instructions.format(
-            focus=analyst.description) + strategic_rules
+        strategic_rules = get_strategic_rules(agent_name, config)
+        enhanced_prompt = section_writer_instructions + strategic_rules
     else:
-        enhanced_prompt = section_writer_instructions.format(
-            focus=analyst.description)
+        enhanced_prompt = section_writer_instructions
 
-    section = llm.invoke([
+    section = await get_llm().ainvoke([
         SystemMessage(content=enhanced_prompt),
-        HumanMessage(
-            content=f"Use this source to write your section: {context}")
+        HumanMessage(content=section_writer_context.format(
+            focus=analyst.description,
+            context=context
+        ))
     ])
 
-    # Let SCOPE observe and learn
+    # Let SCOPE observe and learn, off the critical path
     if optimizer:
-        source_count = len(re.findall(r'\[\d+\]', section.content))
+        source_count = sum(1 for _ in _CITATION_RE.finditer(section.content))
         observations = f"Section: {len(section.content)} chars, {source_count} citations"
 
-        _observe_with_scope(
-            optimizer,
+        _observe_in_background(
+            config, optimizer,
             agent_name=agent_name,
             agent_role="Transform interviews into report sections",
             task=f"Write section on: {analyst.description[:80]}",
@@ -415,95 +529,88 @@ def write_section(state: InterviewState):
     return {"sections": [section.content]}
 
 
-def write_report(state: ResearchGraphState):
-    """Write final report from sections"""
-    sections = state["sections"]
-    topic = state["topic"]
+def prepare_report(state: ResearchGraphState):
+    """Join point after all interviews: format the sections once for the writers"""
+    return {"formatted_str_sections": "\n\n".join(state["sections"])}
 
-    formatted_str_sections = "\n\n".join(
-        [f"{section}" for section in sections])
-    system_message = report_writer_instructions.format(
-        topic=topic,
-        context=formatted_str_sections
-    )
 
-    report = llm.invoke([
-        SystemMessage(content=system_message),
-        HumanMessage(content="Write a report based upon these memos.")
-    ])
-
-    return {"content": report.content}
-
-
-def write_introduction(state: ResearchGraphState):
-    """Write introduction for report"""
-    sections = state["sections"]
+async def write_report_bundle(state: ResearchGraphState):
+    """Write the report body, introduction and conclusion concurrently"""
     topic = state["topic"]
-
-    formatted_str_sections = "\n\n".join(
-        [f"{section}" for section in sections])
-    instructions = intro_conclusion_instructions.format(
-        topic=topic,
-        formatted_str_sections=formatted_str_sections
-    )
-
-    intro = llm.invoke([
-        instructions,
+    formatted_str_sections = state["formatted_str_sections"]
+
+    # Static instructions lead each prompt so the provider can cache them;
+    # topic and sections follow in the user turn
+    report_messages = [
+        SystemMessage(content=report_writer_instructions),
+        HumanMessage(content=report_writer_context.format(
+            topic=topic,
+            context=formatted_str_sections
+        )),
+        HumanMessage(content="Write a report based upon these memos.")
+    ]
+    # Introduction and conclusion share everything but the final request
+    intro_conclusion_prefix = [
+        SystemMessage(content=intro_conclusion_instructions),
+        HumanMessage(content=intro_conclusion_context.format(
+            topic=topic,
+            formatted_str_sections=formatted_str_sections
+        ))
+    ]
+    intro_messages = intro_conclusion_prefix + [
         HumanMessage(content="Write the report introduction")
-    ])
-
-    return {"introduction": intro.content}
-
-
-def write_conclusion(state: ResearchGraphState):
-    """Write conclusion for report"""
-    sections = state["sections"]
-    topic = state["topic"]
+    ]
+    conclusion_messages = intro_conclusion_prefix + [
+        HumanMessage(content="Write the report conclusion")
+    ]
 
-    formatted_str_sections = "\n\n".join(
-        [f"{section}" for section in sections])
-    instructions = intro_conclusion_instructions.format(
-        topic=topic,
-        formatted_str_sections=formatted_str_sections
+    # The three writes are independent, so wait for the slowest, not the sum
+    report, intro, conclusion = await asyncio.gather(
+        get_llm().ainvoke(report_messages),
+        get_llm().ainvoke(intro_messages),
+        get_llm().ainvoke(conclusion_messages)
     )
 
-    conclusion = llm.invoke([
-        instructions,
-        HumanMessage(content="Write the report conclusion")
-    ])
-
-    return {"conclusion": conclusion.content}
+    return {
+        "content": report.content,
+        "introduction": intro.content,
+        "conclusion": conclusion.content
+    }
 
 
-def finalize_report(state: ResearchGraphState):
+async def finalize_report(state: ResearchGraphState, config: RunnableConfig):
     """Finalize the report by combining all sections with SCOPE quality feedback"""
-    optimizer = get_scope_optimizer()
+    optimizer = get_scope_optimizer(config)
 
-    content = state["content"]
+    content = state["content"].removeprefix("## Insights").lstrip()
 
-    if content.startswith("## Insights"):
-        content = content.strip("## Insights")
-
-    if "## Sources" in content:
-        try:
-            content, sources = content.split("\n## Sources\n")
-        except:
-            sources = None
+    # Split off the trailing sources list, if the writer produced one
+    body, separator, sources = content.rpartition("\n## Sources\n")
+    if separator:
+        content = body
     else:
         sources = None
 
-    final_report = (
-        state["introduction"] + "\n\n---\n\n" +
-        content + "\n\n---\n\n" +
+    parts = [
+        state["introduction"], "\n\n---\n\n",
+        content, "\n\n---\n\n",
         state["conclusion"]
-    )
-
+    ]
     if sources is not None:
-        final_report += "\n\n## Sources\n" + sources
+        parts += ["\n\n## Sources\n", sources]
+    final_report = "".join(parts)
+
+    # Unique citations: bracketed references and raw URLs. The two match
+    # sets are disjoint ("[1]" is never a URL), so no union is needed.
+    bracket_citations = _CITATION_RE.findall(final_report)
+    citations = [*set(bracket_citations), *set(_URL_RE.findall(final_report))]
+
+    # Nothing learned during the interviews may be lost
+    scope_events = await _collect_observations(config)
 
     # Quality feedback loop: Let SCOPE learn from final report quality
     if optimizer and final_report:
-        source_count = len(re.findall(r'\[\d+\]', final_report))
+        source_count = len(bracket_citations)
 
         quality_summary = f"""Research completed successfully
 - Report length: {len(final_report)} chars
@@ -511,7 +618,7 @@ def finalize_report(state: ResearchGraphState):
 - Sources cited: {source_count}
 - Analysts involved: {len(state.get('analysts', []))}"""
 
-        _observe_with_scope(
+        event = await _observe_with_scope(
             optimizer,
             agent_name="research_coordinator",
             agent_role="Orchestrate multi-analyst research process",
@@ -521,5 +628,11 @@ def finalize_report(state: ResearchGraphState):
             current_prompt="",
             task_id=f"research_{state.get('topic', 'unknown')[:20]}"
         )
-
-    return {"final_report": final_report}
+        if event:
+            scope_events.append(event)
+
+    return {
+        "final_report": final_report,
+        "citations": citations,
+        "scope_events": scope_events
+    }
@@ -21,7 +21,7 @@ Your goal is boil down to interesting and specific insights related to your topi
         
 2. Specific: Insights that avoid generalities and include specific examples from the expert.
 
-Here is your topic of focus and set of goals: {goals}
+Your topic of focus and set of goals are provided at the start of the conversation.
         
 Begin by introducing yourself using a name that fits your persona, and then ask your question.
 
@@ -31,6 +31,8 @@ When you are satisfied with your understanding, complete the interview with: "Th
 
 Remember to stay in character throughout your response, reflecting the persona and goals provided to you."""
 
+question_context = """Here is your topic of focus and set of goals: {goals}"""
+
 search_instructions = """You will be given a conversation between an analyst and an expert. 
 
 Your goal is to carefully analyze the conversation and generate a well-structured and effective query that can be used for retrieval and / or web-search related to the conversation.
@@ -43,13 +45,11 @@ Then, please convert this final question into a well-structured and effective we
 
 answer_instructions = """You are an expert being interviewed by an analyst.
 
-Here is analyst area of focus: {goals}. 
+The analyst area of focus and the context for your answer are provided at the start of the conversation.
         
 Your goal is to carefully and thoroughly answer a question posed by the interviewer.
 
-To answer the question, please use this context that has been provided:
-        
-{context}
+To answer the question, please use the context that has been provided.
 
 When answering questions, please follow these important guidelines carefully:
         
@@ -69,6 +69,12 @@ When answering questions, please follow these important guidelines carefully:
         
 And please skip the addition of the brackets as well as the Document source preamble in your citation."""
 
+answer_context = """Here is analyst area of focus: {goals}. 
+
+To answer the question, please use this context that has been provided:
+        
+{context}"""
+
 section_writer_instructions = """You are an expert technical writer. 
             
 Your task is to create a short, easily digestible section of a report based on a set of source documents.
@@ -85,8 +91,7 @@ a. Title (## header)
 b. Summary (### header)
 c. Sources (### header)
 
-4. Make your title engaging based upon the focus area of the analyst: 
-{focus}
+4. Make your title engaging based upon the focus area of the analyst, which is provided with the source documents.
 
 5. For the summary section:
 - Set up summary with general background / context related to the focus area of the analyst
@@ -120,9 +125,11 @@ There should be no redundant sources. It should simply be:
 - Include no preamble before the title of the report
 - Check that all guidelines have been followed"""
 
-report_writer_instructions = """You are a technical writer creating a report on this overall topic: 
+section_writer_context = """Focus area of the analyst: {focus}
 
-{topic}
+Use this source to write your section: {context}"""
+
+report_writer_instructions = """You are a technical writer creating a report on an overall topic, which is provided along with the memos.
     
 You have a team of analysts. Each analyst has done two things: 
 
@@ -148,15 +155,19 @@ To format your report:
 8. List your sources in order and do not repeat.
 
 [1] Source 1
-[2] Source 2
+[2] Source 2"""
+
+report_writer_context = """Here is the overall topic of the report: 
+
+{topic}
 
 Here are the memos from your analysts to build your report from: 
 
 {context}"""
 
-intro_conclusion_instructions = """You are a technical writer finishing a report on {topic}
+intro_conclusion_instructions = """You are a technical writer finishing a report.
 
-You will be given all of the sections of the report.
+You will be given the topic and all of the sections of the report.
 
 You job is to write a crisp and compelling introduction or conclusion section.
 
@@ -172,6 +183,8 @@ For your introduction, create a compelling title and use the # header for the ti
 
 For your introduction, use ## Introduction as the section header. 
 
-For your conclusion, use ## Conclusion as the section header.
+For your conclusion, use ## Conclusion as the section header."""
+
+intro_conclusion_context = """Here is the topic of the report: {topic}
 
 Here are the sections to reflect on for writing: {formatted_str_sections}"""
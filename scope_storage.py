@@ -0,0 +1,49 @@
+"""
+SCOPE Data Storage
+
+File helpers shared by the comparison scripts: resetting SCOPE data
+directories and reading/writing their JSON files.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def discard_dir(path: Path):
+    """Move ``path`` aside and delete it in a background thread.
+
+    The rename is a single metadata operation, so the caller can recreate
+    ``path`` immediately; the thread is not a daemon, so the deletion still
+    finishes before the interpreter exits.
+    """
+    trash = path.with_name(f"{path.name}.trash.{os.getpid()}.{time.time_ns()}")
+    try:
+        path.rename(trash)
+    except FileNotFoundError:
+        return
+    threading.Thread(target=shutil.rmtree, args=(trash,),
+                     kwargs={"ignore_errors": True}).start()
+
+
+def read_json(path: Path):
+    """Parse a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+def write_json(path: Path, data):
+    """Write ``data`` as indented JSON, using orjson when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2))
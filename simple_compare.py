@@ -17,138 +17,70 @@ Usage:
 """
 import asyncio
 import argparse
-import json
-import os
-import shutil
+import importlib.util
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
+
+from extraction import (
+    AGENT_NAME, BASE_PROMPT, EXTRACTION_TASKS, build_prompt, create_optimizer,
+    extract_all, observe_extraction
+)
+from scope_storage import discard_dir, write_json
+# langchain_openai and scope are imported in create_clients, so --help and
+# argument errors don't pay for them
 
 # Load environment
 load_dotenv()
 
-# Check for SCOPE
-try:
-    from scope import SCOPEOptimizer
-    from scope.models import create_openai_model
-    SCOPE_AVAILABLE = True
-except ImportError:
-    print("⚠️  SCOPE not installed. Install with: pip install scope-optimizer")
-    exit(1)
-
-# Base prompt
-BASE_PROMPT = """You are an information extraction specialist.
-Your task is to extract requested information from text accurately.
-
-## Core Instructions:
-- Extract only the requested information
-- Be accurate and precise
-- If information is missing, state "Not found"
-- Provide clean, structured output
-"""
-
-# Extraction tasks
-EXTRACTION_TASKS = [
-    {
-        "instruction": "Extract the email address",
-        "text": "Contact John Doe at john.doe@example.com for support"
-    },
-    {
-        "instruction": "Parse and extract: name, age, and city",
-        "text": "Name: Jane Smith, Age: 28, City: Boston"
-    },
-    {
-        "instruction": "Extract the phone number",
-        "text": "You can email us at support@company.com"
-    },
-    {
-        "instruction": "Extract name, age, city, and phone",
-        "text": "name:John|age:35|city:NYC|phone:555-0123"
-    },
-    {
-        "instruction": "Extract all email addresses",
-        "text": "Team: alice@test.com, Bob <bob@example.org>, charlie@mail.net"
-    },
-]
-
 
-async def extract_with_scope(llm, optimizer, instruction, text, task_id):
-    """Extract information and let SCOPE observe."""
+def create_clients():
+    """Create the LLM and SCOPE optimizer shared by all iterations."""
     
-    strategic_rules = optimizer.get_strategic_rules_for_agent("info_extractor")
-    current_prompt = BASE_PROMPT
-    if strategic_rules:
-        current_prompt += f"\n\n## Strategic Guidelines (Learned):\n{strategic_rules}"
+    from langchain_openai import ChatOpenAI
+    from llm_cache import install_llm_cache
     
-    messages = [
-        SystemMessage(content=current_prompt),
-        HumanMessage(content=f"{instruction}\n\nText: {text}")
-    ]
+    install_llm_cache()
+    llm = ChatOpenAI(model="gpt-4o", temperature=0)
     
-    response = llm.invoke(messages)
-    output = response.content
-    
-    result = await optimizer.on_step_complete(
-        agent_name="info_extractor",
-        agent_role="Information Extraction Specialist",
-        task=f"{instruction} | Text: {text}",
-        model_output=output,
-        observations=f"Extracted from: '{text[:50]}...'",
-        error=None,
-        current_system_prompt=current_prompt,
-        task_id=task_id
-    )
-    
-    return output, result
+    return llm, create_optimizer()
 
 
-async def run_iteration(iteration_num: int):
-    """Run one complete iteration."""
+async def run_iteration(iteration_num: int, llm, optimizer, initial_rules: int = None):
+    """Run one complete iteration.
+
+    initial_rules is the rule count the previous iteration ended with;
+    it is only read from SCOPE when not known yet.
+    """
     
     print(f"\n{'='*70}")
     print(f"ITERATION {iteration_num}")
     print(f"{'='*70}\n")
     
-    # Initialize
-    llm = ChatOpenAI(model="gpt-4o", temperature=0)
+    # Get current rules count (carried over from the previous iteration)
+    if initial_rules is None:
+        strategic_rules = optimizer.get_strategic_rules_for_agent(AGENT_NAME)
+        initial_rules = len(strategic_rules.split('\n')) if strategic_rules else 0
     
-    scope_model = create_openai_model(
-        model="gpt-4o",
-        api_key=os.environ["OPENAI_API_KEY"]
-    )
-    
-    optimizer = SCOPEOptimizer(
-        synthesizer_model=scope_model,
-        exp_path="./scope_data",
-        enable_quality_analysis=True,
-        quality_analysis_frequency=1,
-        synthesis_mode="efficiency",
-        store_history=True
-    )
-    
-    # Get current rules count
-    strategic_rules = optimizer.get_strategic_rules_for_agent("info_extractor")
-    initial_rules = len(strategic_rules.split('\n')) if strategic_rules else 0
-    
-    # Run tasks
+    # Run all extractions concurrently with this iteration's prompt
+    current_prompt = build_prompt(optimizer)
+    outputs = await extract_all(llm, current_prompt)
+    
+    # Let SCOPE observe the results in task order
     learning_events = []
-    outputs = []
     
-    for i, task in enumerate(EXTRACTION_TASKS, 1):
+    for i, (task, output) in enumerate(zip(EXTRACTION_TASKS, outputs), 1):
         print(f"Task {i}/{len(EXTRACTION_TASKS)}: {task['instruction'][:50]}...", end=" ")
         
-        output, learning_result = await extract_with_scope(
-            llm,
+        learning_result = await observe_extraction(
             optimizer,
             task['instruction'],
             task['text'],
+            output,
+            current_prompt,
             f"iter{iteration_num}_task{i}"
         )
         
-        outputs.append(output)
-        
         if learning_result:
             guideline, guideline_type = learning_result
             learning_events.append({
@@ -160,7 +92,7 @@ async def run_iteration(iteration_num: int):
             print("✓")
     
     # Get final rules count
-    final_rules_text = optimizer.get_strategic_rules_for_agent("info_extractor")
+    final_rules_text = optimizer.get_strategic_rules_for_agent(AGENT_NAME)
     final_rules = len(final_rules_text.split('\n')) if final_rules_text else 0
     
     # Calculate metrics
@@ -184,61 +116,64 @@ async def run_iteration(iteration_num: int):
     return results, final_rules_text
 
 
-def save_results(all_results, output_dir):
+def save_results(all_results, output_dir, run_started):
     """Save comparison results."""
     
     output_dir = Path(output_dir)
-    output_dir.mkdir(exist_ok=True)
     
     # Save iteration data
     iteration_file = output_dir / "simple_iteration_data.json"
-    with open(iteration_file, 'w') as f:
-        json.dump(all_results, f, indent=2)
+    write_json(iteration_file, all_results)
     
     # Generate summary markdown
     summary_file = output_dir / "simple_results_summary.md"
     
-    with open(summary_file, 'w') as f:
-        f.write("# Simple Demo - SCOPE Learning Progression\n\n")
-        f.write(f"**Task:** Information Extraction\n")
-        f.write(f"**Total Iterations:** {len(all_results)}\n")
-        f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        
-        f.write("## Iteration Summary\n\n")
-        f.write("| Iter | Tasks | Learning Events | New Rules | Total Rules | Avg Output Length |\n")
-        f.write("|------|-------|----------------|-----------|-------------|-------------------|\n")
-        
-        for r in all_results:
-            f.write(f"| {r['iteration']} | {r['tasks_completed']} | "
-                   f"{r['learning_events']} | {r['strategic_rules']} | "
-                   f"{r['total_rules']} | {r['avg_output_length']} |\n")
-        
-        f.write("\n## Key Metrics\n\n")
-        
-        if len(all_results) > 1:
-            first = all_results[0]
-            last = all_results[-1]
-            
-            learning_change = ((last['learning_events'] - first['learning_events']) / 
-                             max(first['learning_events'], 1) * 100)
-            
-            f.write(f"- **Initial Learning Events:** {first['learning_events']}\n")
-            f.write(f"- **Final Learning Events:** {last['learning_events']}\n")
-            f.write(f"- **Learning Event Change:** {learning_change:+.0f}%\n")
-            f.write(f"- **Total Rules Accumulated:** {last['total_rules']}\n\n")
+    lines = [
+        "# Simple Demo - SCOPE Learning Progression\n\n",
+        "**Task:** Information Extraction\n",
+        f"**Total Iterations:** {len(all_results)}\n",
+        f"**Generated:** {run_started.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        "## Iteration Summary\n\n",
+        "| Iter | Tasks | Learning Events | New Rules | Total Rules | Avg Output Length |\n",
+        "|------|-------|----------------|-----------|-------------|-------------------|\n",
+    ]
+    
+    for r in all_results:
+        lines.append(f"| {r['iteration']} | {r['tasks_completed']} | "
+                     f"{r['learning_events']} | {r['strategic_rules']} | "
+                     f"{r['total_rules']} | {r['avg_output_length']} |\n")
+    
+    lines.append("\n## Key Metrics\n\n")
+    
+    if len(all_results) > 1:
+        first = all_results[0]
+        last = all_results[-1]
         
-        f.write("## What This Shows\n\n")
-        f.write("**Decreasing learning events = Better prompts!**\n\n")
-        f.write("As SCOPE learns, it finds fewer issues with outputs, meaning the ")
-        f.write("prompt is becoming more optimized.\n\n")
+        learning_change = ((last['learning_events'] - first['learning_events']) / 
+                         max(first['learning_events'], 1) * 100)
         
-        f.write("## Learning Examples\n\n")
-        for r in all_results[:5]:  # First 5 iterations
-            if r['learned_this_iter']:
-                f.write(f"### Iteration {r['iteration']}\n\n")
-                for rule in r['learned_this_iter'][:3]:  # Top 3 rules
-                    f.write(f"- {rule}...\n")
-                f.write("\n")
+        lines += [
+            f"- **Initial Learning Events:** {first['learning_events']}\n",
+            f"- **Final Learning Events:** {last['learning_events']}\n",
+            f"- **Learning Event Change:** {learning_change:+.0f}%\n",
+            f"- **Total Rules Accumulated:** {last['total_rules']}\n\n",
+        ]
+    
+    lines += [
+        "## What This Shows\n\n",
+        "**Decreasing learning events = Better prompts!**\n\n",
+        "As SCOPE learns, it finds fewer issues with outputs, meaning the ",
+        "prompt is becoming more optimized.\n\n",
+        "## Learning Examples\n\n",
+    ]
+    for r in all_results[:5]:  # First 5 iterations
+        if r['learned_this_iter']:
+            lines.append(f"### Iteration {r['iteration']}\n\n")
+            for rule in r['learned_this_iter'][:3]:  # Top 3 rules
+                lines.append(f"- {rule}...\n")
+            lines.append("\n")
+    
+    summary_file.write_text("".join(lines))
     
     print(f"\n📊 Results saved:")
     print(f"   • Summary: {summary_file}")
@@ -255,6 +190,12 @@ async def main():
                        help='Output directory (default: ./comparison_outputs)')
     
     args = parser.parse_args()
+    run_started = datetime.now()
+    
+    # Check for SCOPE before asking anything (it is imported later)
+    if importlib.util.find_spec("scope") is None:
+        print("⚠️  SCOPE not installed. Install with: pip install scope-optimizer")
+        exit(1)
     
     print("\n" + "=" * 70)
     print("SIMPLE SCOPE COMPARISON")
@@ -269,27 +210,34 @@ async def main():
     if Path("./scope_data").exists():
         response = input("Clear existing SCOPE data? [Y/n]: ").strip().lower()
         if response != 'n':
-            shutil.rmtree("./scope_data")
+            discard_dir(Path("./scope_data"))
             print("✅ SCOPE data cleared")
     
+    # Prepare output directories once, up front
+    prompts_dir = Path(args.output_dir) / "simple_prompts"
+    prompts_dir.mkdir(parents=True, exist_ok=True)
+    
+    # One LLM client and optimizer for the whole run (after clearing SCOPE data)
+    llm, optimizer = create_clients()
+    
     # Run iterations
     all_results = []
+    total_rules = None
+    snapshot_writes = {}  # Background prompt-snapshot writes, by iteration
     
     for i in range(1, args.iterations + 1):
         try:
-            results, final_prompt = await run_iteration(i)
+            results, final_prompt = await run_iteration(i, llm, optimizer, total_rules)
             all_results.append(results)
+            total_rules = results['total_rules']
             
-            # Save prompt snapshot
-            output_dir = Path(args.output_dir) / "simple_prompts"
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            prompt_file = output_dir / f"prompt_iter_{i}.txt"
-            with open(prompt_file, 'w') as f:
-                f.write(BASE_PROMPT)
-                if final_prompt:
-                    f.write("\n\n## Strategic Guidelines (Learned):\n")
-                    f.write(final_prompt)
+            # Save prompt snapshot in a worker thread, overlapping the next iteration
+            prompt_text = BASE_PROMPT
+            if final_prompt:
+                prompt_text += f"\n\n## Strategic Guidelines (Learned):\n{final_prompt}"
+            prompt_file = prompts_dir / f"prompt_iter_{i}.txt"
+            snapshot_writes[i] = asyncio.create_task(
+                asyncio.to_thread(prompt_file.write_text, prompt_text))
             
         except Exception as e:
             print(f"\n❌ Error in iteration {i}: {e}")
@@ -297,9 +245,15 @@ async def main():
             traceback.print_exc()
             break
     
+    # A failed snapshot only loses that prompt file, not the results
+    outcomes = await asyncio.gather(*snapshot_writes.values(), return_exceptions=True)
+    for i, outcome in zip(snapshot_writes, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"\n⚠️  Could not save prompt snapshot for iteration {i}: {outcome}")
+    
     # Save results
     if all_results:
-        save_results(all_results, args.output_dir)
+        save_results(all_results, args.output_dir, run_started)
         
         print("\n" + "=" * 70)
         print("COMPARISON COMPLETE")
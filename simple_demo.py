@@ -14,93 +14,24 @@ Compare to main.py:
 - Clear: Easy to understand learning patterns
 """
 import asyncio
-import os
+import importlib.util
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
+
+from extraction import (
+    AGENT_NAME, BASE_PROMPT, EXTRACTION_TASKS, build_prompt, create_optimizer,
+    extract_all, observe_extraction
+)
+from llm_cache import install_llm_cache
 
 # Load environment variables
 load_dotenv()
 
 # Check for SCOPE
-try:
-    from scope import SCOPEOptimizer
-    from scope.models import create_openai_model
-    SCOPE_AVAILABLE = True
-except ImportError:
+if importlib.util.find_spec("scope") is None:
     print("⚠️  SCOPE not installed. Install with: pip install scope-optimizer")
-    SCOPE_AVAILABLE = False
     exit(1)
 
-# Base extraction prompt
-BASE_PROMPT = """You are an information extraction specialist.
-Your task is to extract requested information from text accurately.
-
-## Core Instructions:
-- Extract only the requested information
-- Be accurate and precise
-- If information is missing, state "Not found"
-- Provide clean, structured output
-"""
-
-# Sample extraction tasks
-EXTRACTION_TASKS = [
-    {
-        "instruction": "Extract the email address",
-        "text": "Contact John Doe at john.doe@example.com for support"
-    },
-    {
-        "instruction": "Parse and extract: name, age, and city",
-        "text": "Name: Jane Smith, Age: 28, City: Boston"
-    },
-    {
-        "instruction": "Extract the phone number",
-        "text": "You can email us at support@company.com"
-    },
-    {
-        "instruction": "Extract name, age, city, and phone",
-        "text": "name:John|age:35|city:NYC|phone:555-0123"
-    },
-    {
-        "instruction": "Extract all email addresses",
-        "text": "Team: alice@test.com, Bob <bob@example.org>, charlie@mail.net"
-    },
-]
-
-
-async def extract_with_scope(llm, optimizer, instruction, text, task_id):
-    """Extract information and let SCOPE observe."""
-    
-    # Get current prompt with learned rules
-    strategic_rules = optimizer.get_strategic_rules_for_agent("info_extractor")
-    current_prompt = BASE_PROMPT
-    if strategic_rules:
-        current_prompt += f"\n\n## Strategic Guidelines (Learned):\n{strategic_rules}"
-    
-    # Create messages
-    messages = [
-        SystemMessage(content=current_prompt),
-        HumanMessage(content=f"{instruction}\n\nText: {text}")
-    ]
-    
-    # Get response
-    response = llm.invoke(messages)
-    output = response.content
-    
-    # Let SCOPE observe
-    result = await optimizer.on_step_complete(
-        agent_name="info_extractor",
-        agent_role="Information Extraction Specialist",
-        task=f"{instruction} | Text: {text}",
-        model_output=output,
-        observations=f"Extracted from: '{text[:50]}...'",
-        error=None,
-        current_system_prompt=current_prompt,
-        task_id=task_id
-    )
-    
-    return output, result
-
 
 async def main():
     """Run simple extraction demo with SCOPE."""
@@ -110,24 +41,13 @@ async def main():
     print("=" * 70)
     print("\nThis demo shows SCOPE learning to extract information better.\n")
     
-    # Initialize LLM
+    # Initialize LLM (reruns answer from LLM_CACHE_PATH when it is set)
+    install_llm_cache()
     llm = ChatOpenAI(model="gpt-4o", temperature=0)
     print("✅ LangChain ChatOpenAI initialized (gpt-4o)")
     
     # Initialize SCOPE
-    scope_model = create_openai_model(
-        model="gpt-4o",
-        api_key=os.environ["OPENAI_API_KEY"]
-    )
-    
-    optimizer = SCOPEOptimizer(
-        synthesizer_model=scope_model,
-        exp_path="./scope_data",
-        enable_quality_analysis=True,
-        quality_analysis_frequency=1,
-        synthesis_mode="efficiency",
-        store_history=True
-    )
+    optimizer = create_optimizer()
     
     print("✅ SCOPE Optimizer initialized\n")
     
@@ -135,18 +55,24 @@ async def main():
     print("🚀 Running extraction tasks...\n")
     print("=" * 70)
     
+    # The extractions are independent, so run them all at once; SCOPE then
+    # observes the results one by one, in task order
+    current_prompt = build_prompt(optimizer)
+    outputs = await extract_all(llm, current_prompt)
+    
     learning_events = []
     
-    for i, task in enumerate(EXTRACTION_TASKS, 1):
+    for i, (task, output) in enumerate(zip(EXTRACTION_TASKS, outputs), 1):
         print(f"\n📝 Task {i}/{len(EXTRACTION_TASKS)}")
         print(f"   Instruction: {task['instruction']}")
         print(f"   Text: {task['text']}")
         
-        output, learning_result = await extract_with_scope(
-            llm,
+        learning_result = await observe_extraction(
             optimizer,
             task['instruction'],
             task['text'],
+            output,
+            current_prompt,
             f"task_{i}"
         )
         
@@ -177,7 +103,7 @@ async def main():
             print(f"   • Task {event['task']}: {event['rule'][:80]}...")
     
     # Show evolved prompt
-    strategic_rules = optimizer.get_strategic_rules_for_agent("info_extractor")
+    strategic_rules = optimizer.get_strategic_rules_for_agent(AGENT_NAME)
     if strategic_rules:
         print("\n" + "=" * 70)
         print("EVOLVED PROMPT")
@@ -5,8 +5,10 @@ Evaluates the trustworthiness and academic credibility of sources
 so SCOPE can learn to prioritize high-quality references.
 """
 
+import functools
 import re
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 from urllib.parse import urlparse
 
 
@@ -43,97 +45,97 @@ BLOG_INDICATORS = ['blog', 'wordpress', 'medium.com', 'tumblr', 'blogspot']
 LOW_QUALITY_INDICATORS = ['listicle', 'top-10', 'you-wont-believe']
 
 
-def classify_source(url: str) -> Dict[str, any]:
+def _substring_pattern(needles) -> re.Pattern:
+    """One alternation matching any of the needles anywhere in a string"""
+    return re.compile("|".join(re.escape(needle) for needle in sorted(needles)))
+
+
+# Each list above collapses into a single regex scan per URL
+_ACADEMIC_RE = _substring_pattern(ACADEMIC_DOMAINS)
+_NEWS_RE = _substring_pattern(NEWS_DOMAINS)
+_BLOG_RE = _substring_pattern(BLOG_INDICATORS)
+_LOW_QUALITY_RE = _substring_pattern(LOW_QUALITY_INDICATORS)
+_PEER_REVIEW_RE = _substring_pattern(['journal', 'article', 'doi'])
+
+
+def _classification(source_type: str, authority: str, score: int, reasoning: str) -> Mapping[str, Any]:
+    """Read-only classification result, shared by every matching URL"""
+    return MappingProxyType({
+        'type': source_type,
+        'authority': authority,
+        'score': score,
+        'reasoning': reasoning
+    })
+
+
+# Every possible classification, built once
+_UNKNOWN = _classification('unknown', 'unknown', 0, 'No URL provided')
+_ACADEMIC_JOURNAL = _classification('academic_journal', 'high', 10, 'Peer-reviewed academic journal')
+_ACADEMIC_INSTITUTION = _classification('academic_institution', 'high', 9, 'Academic institution')
+_MEDICAL_DATABASE = _classification('medical_database', 'high', 10, 'Medical research database (NIH)')
+_GOVERNMENT = _classification('government', 'high', 9, 'Government/official source')
+_ACADEMIC = _classification('academic', 'high', 8, 'Academic or research source')
+_NEWS_REPUTABLE = _classification('news_reputable', 'medium-high', 7, 'Reputable news organization')
+_BLOG = _classification('blog', 'low', 3, 'Blog or personal website')
+_CONTENT_FARM = _classification('content_farm', 'very_low', 2, 'Low-quality content (listicle/clickbait)')
+_PROFESSIONAL = _classification('professional', 'medium', 5, 'Professional website or organization')
+
+
+def classify_source(url: str) -> Mapping[str, Any]:
     """
     Classify a source by its URL and return quality metrics.
     
     Returns:
-        dict with keys: type, authority, score, reasoning
+        read-only mapping with keys: type, authority, score, reasoning
+        (shared between calls; copy with dict() before modifying)
     """
     if not url:
-        return {
-            'type': 'unknown',
-            'authority': 'unknown',
-            'score': 0,
-            'reasoning': 'No URL provided'
-        }
-    
-    domain = urlparse(url).netloc.lower()
-    path = urlparse(url).path.lower()
-    
+        return _UNKNOWN
+    
+    parsed = urlparse(url)
+    path = parsed.path.lower()
+    
+    # Only these path features affect the result, so many URLs share a key
+    return _classify_parts(
+        parsed.netloc.lower(),
+        _PEER_REVIEW_RE.search(path) is not None,
+        _BLOG_RE.search(path) is not None,
+        _LOW_QUALITY_RE.search(path) is not None
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_parts(domain: str, peer_reviewed_path: bool, blog_path: bool,
+                    low_quality_path: bool) -> Mapping[str, Any]:
+    """Classify a (domain, path features) pair"""
     # Check for academic sources (highest quality)
-    if any(academic_domain in domain for academic_domain in ACADEMIC_DOMAINS):
+    if _ACADEMIC_RE.search(domain):
         # Extra points for peer-reviewed indicators
-        if 'journal' in path or 'article' in path or 'doi' in path:
-            return {
-                'type': 'academic_journal',
-                'authority': 'high',
-                'score': 10,
-                'reasoning': 'Peer-reviewed academic journal'
-            }
+        if peer_reviewed_path:
+            return _ACADEMIC_JOURNAL
         elif '.edu' in domain or '.ac.' in domain:
-            return {
-                'type': 'academic_institution',
-                'authority': 'high',
-                'score': 9,
-                'reasoning': 'Academic institution'
-            }
+            return _ACADEMIC_INSTITUTION
         elif 'pmc.ncbi' in domain or 'pubmed' in domain:
-            return {
-                'type': 'medical_database',
-                'authority': 'high',
-                'score': 10,
-                'reasoning': 'Medical research database (NIH)'
-            }
+            return _MEDICAL_DATABASE
         elif '.gov' in domain:
-            return {
-                'type': 'government',
-                'authority': 'high',
-                'score': 9,
-                'reasoning': 'Government/official source'
-            }
+            return _GOVERNMENT
         else:
-            return {
-                'type': 'academic',
-                'authority': 'high',
-                'score': 8,
-                'reasoning': 'Academic or research source'
-            }
+            return _ACADEMIC
     
     # Check for reputable news sources (medium-high quality)
-    if any(news_domain in domain for news_domain in NEWS_DOMAINS):
-        return {
-            'type': 'news_reputable',
-            'authority': 'medium-high',
-            'score': 7,
-            'reasoning': 'Reputable news organization'
-        }
+    if _NEWS_RE.search(domain):
+        return _NEWS_REPUTABLE
     
     # Check for blogs (lower quality for academic research)
-    if any(indicator in domain or indicator in path for indicator in BLOG_INDICATORS):
-        return {
-            'type': 'blog',
-            'authority': 'low',
-            'score': 3,
-            'reasoning': 'Blog or personal website'
-        }
+    if blog_path or _BLOG_RE.search(domain):
+        return _BLOG
     
     # Check for low-quality indicators
-    if any(indicator in path for indicator in LOW_QUALITY_INDICATORS):
-        return {
-            'type': 'content_farm',
-            'authority': 'very_low',
-            'score': 2,
-            'reasoning': 'Low-quality content (listicle/clickbait)'
-        }
+    if low_quality_path:
+        return _CONTENT_FARM
     
     # Default: professional website (medium quality)
-    return {
-        'type': 'professional',
-        'authority': 'medium',
-        'score': 5,
-        'reasoning': 'Professional website or organization'
-    }
+    return _PROFESSIONAL
 
 
 def assess_sources_quality(sources: List[Dict]) -> Dict[str, any]:
@@ -155,18 +157,27 @@ def assess_sources_quality(sources: List[Dict]) -> Dict[str, any]:
         }
     
     classifications = []
-    scores = []
+    by_url = {}  # Duplicate URLs are parsed and classified once
+    total_score = high_quality = medium_quality = low_quality = 0
     
+    # Single pass: classify, sum scores and bucket by authority
     for source in sources:
         url = source.get('url', '')
-        classification = classify_source(url)
+        classification = by_url.get(url)
+        if classification is None:
+            classification = by_url[url] = classify_source(url)
         classifications.append(classification)
-        scores.append(classification['score'])
+        
+        score = classification['score']
+        total_score += score
+        if score >= 8:
+            high_quality += 1
+        elif score >= 5:
+            medium_quality += 1
+        else:
+            low_quality += 1
     
-    avg_score = sum(scores) / len(scores) if scores else 0
-    high_quality = sum(1 for c in classifications if c['score'] >= 8)
-    medium_quality = sum(1 for c in classifications if 5 <= c['score'] < 8)
-    low_quality = sum(1 for c in classifications if c['score'] < 5)
+    avg_score = total_score / len(classifications)
     
     # Build detailed summary
     quality_breakdown = []
@@ -0,0 +1,81 @@
+"""
+Async Wikipedia Search
+
+Queries the MediaWiki API directly so the article fetches for one
+search run concurrently instead of one after another.
+"""
+
+import asyncio
+from typing import List, Optional
+
+import httpx
+from langchain_core.documents import Document
+
+from clients import get_http_client
+
+
+API_URL = "https://en.wikipedia.org/w/api.php"
+HEADERS = {"User-Agent": "langchain-evolving-prompt-researcher/1.0"}
+
+# Same per-article limit as WikipediaLoader's default
+MAX_CONTENT_CHARS = 4000
+
+
+async def _fetch_page(client: httpx.AsyncClient, page_id: int) -> Optional[Document]:
+    """Fetch the plain-text extract and URL of one article"""
+    response = await client.get(API_URL, headers=HEADERS, params={
+        "action": "query",
+        "prop": "extracts|info",
+        "inprop": "url",
+        "explaintext": 1,
+        "pageids": page_id,
+        "format": "json",
+    })
+    response.raise_for_status()
+    page = response.json()["query"]["pages"][str(page_id)]
+
+    extract = page.get("extract")
+    if not extract:
+        return None
+
+    return Document(
+        page_content=extract[:MAX_CONTENT_CHARS],
+        metadata={"title": page["title"], "source": page["fullurl"]}
+    )
+
+
+async def _search(client: httpx.AsyncClient, query: str, max_docs: int) -> List[Document]:
+    """Run the search and fetch the matching articles concurrently"""
+    response = await client.get(API_URL, headers=HEADERS, params={
+        "action": "query",
+        "list": "search",
+        "srsearch": query,
+        "srlimit": max_docs,
+        "format": "json",
+    })
+    response.raise_for_status()
+    page_ids = [hit["pageid"] for hit in response.json()["query"]["search"]]
+
+    pages = await asyncio.gather(*[
+        _fetch_page(client, page_id) for page_id in page_ids
+    ])
+    return [doc for doc in pages if doc is not None]
+
+
+async def load_wikipedia(query: str, max_docs: int = 2) -> List[Document]:
+    """
+    Search Wikipedia and load the top articles.
+
+    Args:
+        query: Search query
+        max_docs: Maximum number of articles to return
+
+    Returns:
+        Documents with 'title' and 'source' (article URL) metadata
+    """
+    client = get_http_client()
+    if client is None:
+        # Outside a client_session(), use a short-lived client for this search
+        async with httpx.AsyncClient(timeout=60.0) as client:
+            return await _search(client, query, max_docs)
+    return await _search(client, query, max_docs)